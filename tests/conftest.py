@@ -32,6 +32,7 @@ from vllm.inputs import (ExplicitEncoderDecoderPrompt, TextPrompt,
                          TokensPrompt, to_enc_dec_tuple_list,
                          zip_enc_dec_prompts)
 from vllm.logger import init_logger
+from vllm.multimodal import MULTIMODAL_REGISTRY
 from vllm.outputs import RequestOutput
 from vllm.sampling_params import BeamSearchParams
 from vllm.utils import cuda_device_count_stateless, is_list_of
@@ -182,6 +183,7 @@ def should_do_global_cleanup_after_test(request) -> bool:
 @pytest.fixture(autouse=True)
 def cleanup_fixture(should_do_global_cleanup_after_test: bool):
     yield
+    MULTIMODAL_REGISTRY.reset_profiler_cache()
     if should_do_global_cleanup_after_test:
         cleanup_dist_env_and_memory()
 
@@ -0,0 +1,331 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import gc
+import weakref
+from collections.abc import Mapping
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+import vllm.multimodal.profiling as profiling
+from vllm.config import ModelConfig
+from vllm.multimodal import MULTIMODAL_REGISTRY
+from vllm.multimodal.inputs import MultiModalKwargs
+from vllm.multimodal.profiling import (BaseDummyInputsBuilder,
+                                       MultiModalProfiler, ProcessorInputs)
+
+
+class _DummyInputsBuilder(BaseDummyInputsBuilder):
+
+    def get_dummy_processor_inputs(
+        self,
+        seq_len: int,
+        mm_counts: Mapping[str, int],
+    ) -> ProcessorInputs:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def dummy_inputs():
+    return _DummyInputsBuilder(MagicMock())
+
+
+@pytest.mark.parametrize("num_items", [0, 1, 3])
+def test_dummy_images(dummy_inputs, num_items):
+    images = dummy_inputs._get_dummy_images(width=32,
+                                            height=16,
+                                            num_images=num_items)
+
+    assert len(images) == num_items
+    for image in images:
+        assert image.size == (32, 16)
+        assert image is images[0]
+
+
+@pytest.mark.parametrize("num_items", [0, 1, 3])
+def test_dummy_audios(dummy_inputs, num_items):
+    audios = dummy_inputs._get_dummy_audios(length=100,
+                                            num_audios=num_items)
+
+    assert len(audios) == num_items
+    for audio in audios:
+        assert audio.shape == (100, )
+        assert audio is audios[0]
+
+
+@pytest.mark.parametrize(("dtype", "expected_dtype"),
+                         [(None, np.float32), (np.int16, np.int16)])
+def test_dummy_audio_dtype(dummy_inputs, dtype, expected_dtype):
+    kwargs = {} if dtype is None else {"dtype": dtype}
+    audio, = dummy_inputs._get_dummy_audios(length=100,
+                                            num_audios=1,
+                                            **kwargs)
+
+    assert audio.dtype == expected_dtype
+    assert not audio.any()
+
+
+@pytest.mark.parametrize("num_items", [0, 1, 3])
+def test_dummy_videos(dummy_inputs, num_items):
+    videos = dummy_inputs._get_dummy_videos(width=32,
+                                            height=16,
+                                            num_frames=4,
+                                            num_videos=num_items)
+
+    assert len(videos) == num_items
+    for video in videos:
+        assert video.shape == (4, 32, 16, 3)
+        assert video is videos[0]
+
+
+def test_dummy_video_frames(dummy_inputs):
+    video, = dummy_inputs._get_dummy_videos(width=32,
+                                            height=16,
+                                            num_frames=4,
+                                            num_videos=1)
+
+    assert video.dtype == np.uint8
+    assert (video == 255).all()
+
+    # The frames are views of a single frame
+    assert video.strides[0] == 0
+    assert not video.flags.writeable
+
+
+def test_no_dummy_items(dummy_inputs, monkeypatch):
+    # No dummy data should be allocated when no items are requested
+    for name in ("_cached_dummy_audio", "_cached_dummy_image",
+                 "_cached_dummy_video"):
+        monkeypatch.setattr(profiling, name,
+                            MagicMock(side_effect=AssertionError))
+
+    assert dummy_inputs._get_dummy_audios(length=100, num_audios=0) == []
+    assert dummy_inputs._get_dummy_images(width=32, height=16,
+                                          num_images=0) == []
+    assert dummy_inputs._get_dummy_videos(width=32,
+                                          height=16,
+                                          num_frames=4,
+                                          num_videos=0) == []
+
+
+@pytest.mark.parametrize("num_items", [1, 3])
+def test_dummy_items_reused(dummy_inputs, num_items):
+    images = dummy_inputs._get_dummy_images(width=32,
+                                            height=16,
+                                            num_images=num_items)
+    images_again = dummy_inputs._get_dummy_images(width=32,
+                                                  height=16,
+                                                  num_images=num_items)
+    assert all(a is b for a, b in zip(images, images_again))
+
+    audios = dummy_inputs._get_dummy_audios(length=100,
+                                            num_audios=num_items)
+    audios_again = dummy_inputs._get_dummy_audios(length=100,
+                                                  num_audios=num_items)
+    assert all(a is b for a, b in zip(audios, audios_again))
+
+    videos = dummy_inputs._get_dummy_videos(width=32,
+                                            height=16,
+                                            num_frames=4,
+                                            num_videos=num_items)
+    videos_again = dummy_inputs._get_dummy_videos(width=32,
+                                                  height=16,
+                                                  num_frames=4,
+                                                  num_videos=num_items)
+    assert all(a is b for a, b in zip(videos, videos_again))
+
+
+def _create_profiler(token_ids: list[int], *, pad_dummy_encoder_prompt: bool):
+    processor = MagicMock(pad_dummy_encoder_prompt=pad_dummy_encoder_prompt)
+    profiler = MultiModalProfiler(processor)
+
+    mm_inputs = {
+        "prompt_token_ids": token_ids,
+        "encoder_prompt_token_ids": token_ids,
+        "mm_kwargs": MultiModalKwargs({}),
+        "mm_placeholders": {},
+    }
+    profiler.get_and_validate_mm_inputs = MagicMock(
+        return_value=(mm_inputs, {"image": 0}))
+
+    return profiler
+
+
+@pytest.mark.parametrize(
+    ("seq_len", "expected"),
+    [(2, [1, 2, 3]), (3, [1, 2, 3]), (5, [1, 2, 3, 0, 0])],
+)
+def test_decoder_dummy_data_padding(seq_len, expected):
+    token_ids = [1, 2, 3]
+    profiler = _create_profiler(token_ids, pad_dummy_encoder_prompt=False)
+
+    dummy_data = profiler.get_decoder_dummy_data(seq_len)
+
+    assert dummy_data.prompt_token_ids == expected
+    # The processed inputs may be cached, so they should not be aliased
+    assert dummy_data.prompt_token_ids is not token_ids
+    assert token_ids == [1, 2, 3]
+
+
+@pytest.mark.parametrize("pad_dummy_encoder_prompt", [True, False])
+@pytest.mark.parametrize(
+    ("seq_len", "expected"),
+    [(2, [1, 2, 3]), (3, [1, 2, 3]), (5, [1, 2, 3, 0, 0])],
+)
+def test_encoder_dummy_data_padding(seq_len, expected,
+                                    pad_dummy_encoder_prompt):
+    token_ids = [1, 2, 3]
+    profiler = _create_profiler(
+        token_ids, pad_dummy_encoder_prompt=pad_dummy_encoder_prompt)
+
+    dummy_data = profiler.get_encoder_dummy_data(seq_len)
+
+    if not pad_dummy_encoder_prompt:
+        expected = [1, 2, 3]
+
+    assert dummy_data.prompt_token_ids == expected
+    # The processed inputs may be cached, so they should not be aliased
+    assert dummy_data.prompt_token_ids is not token_ids
+    assert token_ids == [1, 2, 3]
+
+
+def test_dummy_data_warning_placeholder_counts(monkeypatch):
+    profiler = _create_profiler([1, 2, 3], pad_dummy_encoder_prompt=False)
+    profiler.get_and_validate_mm_inputs.return_value = (
+        profiler.get_and_validate_mm_inputs.return_value[0],
+        {"image": 2, "video": 1},
+    )
+    warning_once = MagicMock()
+    monkeypatch.setattr(profiling.logger, "warning_once", warning_once)
+
+    profiler.get_encoder_dummy_data(seq_len=2)
+
+    warning_once.assert_called_once()
+    _, *args = warning_once.call_args.args
+    assert args == [2, 3, "image=2, video=1"]
+
+
+def _create_model_config(model_id: str) -> ModelConfig:
+    return ModelConfig(
+        model=model_id,
+        task="auto",
+        tokenizer=model_id,
+        tokenizer_mode="auto",
+        trust_remote_code=False,
+        seed=0,
+        dtype="auto",
+        revision=None,
+    )
+
+
+@pytest.mark.parametrize("model_id", ["llava-hf/llava-v1.6-mistral-7b-hf"])
+def test_dummy_data_cached(model_id):
+    model_config = _create_model_config(model_id)
+
+    profiler = MULTIMODAL_REGISTRY.get_profiler(model_config)
+    processor = profiler.processor
+    processor.apply = MagicMock(wraps=processor.apply)
+
+    seq_len = model_config.max_model_len
+    for _ in range(2):
+        dummy_data = MULTIMODAL_REGISTRY.get_decoder_dummy_data(
+            model_config, seq_len)
+        assert len(dummy_data.prompt_token_ids) >= seq_len
+
+    assert MULTIMODAL_REGISTRY.get_profiler(model_config) is profiler
+    assert processor.apply.call_count == 1
+
+
+@pytest.mark.parametrize("model_id", ["llava-hf/llava-v1.6-mistral-7b-hf"])
+def test_dummy_data_released(model_id):
+    model_config = _create_model_config(model_id)
+
+    profiler = MULTIMODAL_REGISTRY.get_profiler(model_config)
+    profiler_ref = weakref.ref(profiler)
+    del profiler
+
+    dummy_data = MULTIMODAL_REGISTRY.get_decoder_dummy_data(
+        model_config, model_config.max_model_len)
+    mm_kwargs_ref = weakref.ref(dummy_data.multi_modal_data)
+    del dummy_data
+
+    # The processed dummy inputs are cached during profiling...
+    gc.collect()
+    assert mm_kwargs_ref() is not None
+
+    # ...and released afterwards
+    MULTIMODAL_REGISTRY.reset_profiler_cache()
+    gc.collect()
+    assert mm_kwargs_ref() is None
+    assert profiler_ref() is None
+
+
+@pytest.mark.parametrize("model_id", ["llava-hf/llava-v1.6-mistral-7b-hf"])
+def test_dummy_data_cached_across_seq_len(model_id):
+    model_config = _create_model_config(model_id)
+
+    profiler = MULTIMODAL_REGISTRY.get_profiler(model_config)
+    processor = profiler.processor
+    processor.apply = MagicMock(wraps=processor.apply)
+
+    # The dummy data of this model does not depend on `seq_len`
+    max_model_len = model_config.max_model_len
+    for seq_len in (max_model_len, max_model_len - 1):
+        dummy_data = MULTIMODAL_REGISTRY.get_decoder_dummy_data(
+            model_config, seq_len)
+        assert len(dummy_data.prompt_token_ids) >= seq_len
+
+    assert processor.apply.call_count == 1
+
+
+@pytest.mark.parametrize("model_id", ["llava-hf/llava-v1.6-mistral-7b-hf"])
+def test_processor_inputs_released(model_id):
+    model_config = _create_model_config(model_id)
+
+    MULTIMODAL_REGISTRY.get_decoder_dummy_data(model_config,
+                                               model_config.max_model_len)
+
+    profiler = MULTIMODAL_REGISTRY.get_profiler(model_config)
+    (processor_inputs, mm_inputs), = \
+        profiler._processor_outputs_cache.values()
+    refs = [
+        weakref.ref(processor_inputs),
+        weakref.ref(mm_inputs["mm_kwargs"]),
+    ]
+    del profiler, processor_inputs, mm_inputs
+
+    MULTIMODAL_REGISTRY.reset_profiler_cache()
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+
+@pytest.mark.parametrize("model_id", ["llava-hf/llava-v1.6-mistral-7b-hf"])
+def test_mm_limits_cached(model_id):
+    model_config = _create_model_config(model_id)
+
+    info = MULTIMODAL_REGISTRY.get_profiler(model_config).processing_info
+    info.get_supported_mm_limits = MagicMock(
+        wraps=info.get_supported_mm_limits)
+
+    for _ in range(2):
+        assert MULTIMODAL_REGISTRY.get_mm_limits_per_prompt(
+            model_config) == {"image": 1}
+
+    assert info.get_supported_mm_limits.call_count == 1
+
+
+@pytest.mark.parametrize("model_id", ["llava-hf/llava-v1.6-mistral-7b-hf"])
+def test_max_tokens_per_item_uses_profiler(model_id, monkeypatch):
+    model_config = _create_model_config(model_id)
+
+    # No other processor should be created once the profiler exists
+    profiler = MULTIMODAL_REGISTRY.get_profiler(model_config)
+    monkeypatch.setattr(MULTIMODAL_REGISTRY, "create_processor",
+                        MagicMock(side_effect=AssertionError))
+
+    max_tokens = MULTIMODAL_REGISTRY.get_max_tokens_per_item_by_modality(
+        model_config)
+
+    assert max_tokens == profiler.processing_info.get_mm_max_tokens_per_item(
+        model_config.max_model_len, profiler.get_mm_limits())
@@ -216,3 +216,41 @@ def test_custom_logging_config_causes_an_error_if_configure_logging_is_off():
         assert other_logger.handlers != root_logger.handlers
         assert other_logger.level != root_logger.level
         assert other_logger.propagate
+
+
+class _CountingArg:
+
+    def __init__(self) -> None:
+        self.num_formatted = 0
+
+    def __str__(self) -> str:
+        self.num_formatted += 1
+        return "arg"
+
+
+@pytest.mark.parametrize("method_name", ["info_once", "warning_once"])
+def test_log_once_with_args(method_name):
+    root_logger = logging.getLogger("vllm")
+    root_handler = root_logger.handlers[0]
+
+    logger = init_logger(f"vllm.{uuid4()}")
+    log_once = getattr(logger, method_name)
+    arg = _CountingArg()
+
+    with patch.object(root_handler, "emit") as root_handle_mock:
+        log_once("Hello, %s (%d)!", arg, 1)
+        log_once("Hello, %s (%d)!", arg, 1)
+        log_once("Hello, %s (%d)!", arg, 2)
+
+    # Identical calls are deduplicated, but different args are not
+    assert root_handle_mock.call_count == 2
+
+    # The message is only formatted when it is emitted
+    assert arg.num_formatted == 0
+
+    log_records = [call.args[0] for call in root_handle_mock.mock_calls]
+    assert [r.getMessage() for r in log_records] == [
+        "Hello, arg (1)!",
+        "Hello, arg (2)!",
+    ]
+    assert arg.num_formatted == 2
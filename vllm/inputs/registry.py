@@ -327,13 +327,10 @@ class InputRegistry:
         # Avoid circular import
         from vllm.model_executor.model_loader import get_model_architecture
         from vllm.multimodal import MultiModalKwargs
-        from vllm.multimodal.profiling import MultiModalProfiler
         from vllm.sequence import SequenceData
 
         if mm_registry.has_processor(model_config):
-            processor = mm_registry.create_processor(model_config,
-                                                     disable_cache=True)
-            profiler = MultiModalProfiler(processor)
+            profiler = mm_registry.get_profiler(model_config)
 
             dummy_data_v1 = (profiler.get_encoder_dummy_data(seq_len)
                              if is_encoder_data else
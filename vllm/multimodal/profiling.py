@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Hashable, Mapping
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Generic, NamedTuple, Optional, TypeVar, cast
 
 import numpy as np
@@ -11,6 +12,7 @@ from PIL import Image
 
 import vllm.envs as envs
 from vllm.logger import init_logger
+from vllm.utils import LRUCache
 
 from .inputs import (MultiModalDataDict, MultiModalEncDecInputs,
                      MultiModalInputs, MultiModalKwargs,
@@ -48,6 +50,89 @@ class DummyDecoderData(NamedTuple):
 
 _I = TypeVar("_I", bound=BaseProcessingInfo)
 
+_MMInputsCacheKey = tuple[int, tuple[tuple[str, int], ...]]
+
+
+# The dummy data below is shared between calls (and between the items of a
+# single call), so callers must not modify it in-place.
+# Only a few entries are kept since the dummy data can be large and is only
+# needed while profiling.
+@lru_cache(maxsize=2)
+def _cached_dummy_audio(length: int, dtype: np.dtype) -> npt.NDArray:
+    return np.zeros((length, ), dtype=dtype)
+
+
+@lru_cache(maxsize=2)
+def _cached_dummy_image(width: int, height: int) -> Image.Image:
+    return Image.new("RGB", (width, height), color=255)
+
+
+@lru_cache(maxsize=2)
+def _cached_dummy_frame(width: int, height: int) -> npt.NDArray:
+    return np.full((width, height, 3), 255, dtype=np.uint8)
+
+
+@lru_cache(maxsize=2)
+def _cached_dummy_video(width: int, height: int,
+                        num_frames: int) -> npt.NDArray:
+    # Every frame is identical, so expose them as a read-only view of a
+    # single frame instead of allocating `num_frames` copies
+    frame = _cached_dummy_frame(width, height)
+    return np.broadcast_to(frame, (num_frames, *frame.shape))
+
+
+def _get_mm_inputs_cache_key(
+    seq_len: int,
+    mm_counts: Mapping[str, int],
+) -> _MMInputsCacheKey:
+    """Get the key of the dummy inputs for profiling."""
+    return (seq_len, tuple(sorted(mm_counts.items())))
+
+
+def _get_processor_inputs_key(
+        processor_inputs: ProcessorInputs) -> Optional[Hashable]:
+    """
+    Get a key that identifies the result of processing
+    :code:`processor_inputs`, or :code:`None` if it cannot be cached.
+
+    Since the dummy data items are cached (see above), the same items are
+    returned for each :code:`seq_len` that leads to the same dummy data,
+    so they can be compared by identity.
+    """
+    hf_processor_mm_kwargs_key = tuple(
+        sorted(processor_inputs.hf_processor_mm_kwargs.items()))
+    try:
+        hash(hf_processor_mm_kwargs_key)
+    except TypeError:
+        return None
+
+    mm_data_key = tuple(
+        (modality,
+         tuple(map(id, data)) if isinstance(data, list) else id(data))
+        for modality, data in processor_inputs.mm_data.items())
+
+    return (processor_inputs.prompt_text, mm_data_key,
+            hf_processor_mm_kwargs_key)
+
+
+def _pad_token_ids(token_ids: list[int], seq_len: int) -> list[int]:
+    """
+    Right-pad :code:`token_ids` with zeros up to :code:`seq_len` tokens.
+
+    The result is always a new list (so it does not alias the cached
+    processed inputs), allocated once at its final size and filled by slice
+    assignment without building an intermediate list for the padding.
+    """
+    total_len = len(token_ids)
+    padded_token_ids = [0] * max(total_len, seq_len)
+    padded_token_ids[:total_len] = token_ids
+    return padded_token_ids
+
+
+def _format_placeholder_counts(counts: Mapping[str, int]) -> str:
+    return ", ".join(f"{modality}={count}"
+                     for modality, count in counts.items())
+
 
 class BaseDummyInputsBuilder(ABC, Generic[_I]):
     """
@@ -77,8 +162,18 @@ class BaseDummyInputsBuilder(ABC, Generic[_I]):
         *,
         length: int,
         num_audios: int,
+        dtype: npt.DTypeLike = np.float32,
     ) -> list[npt.NDArray]:
-        audio = np.zeros((length, ))
+        """
+        Get :code:`num_audios` silent audios of :code:`length` samples.
+
+        Note:
+            The returned objects share storage, so do not mutate them.
+        """
+        if num_audios == 0:
+            return []
+
+        audio = _cached_dummy_audio(length, np.dtype(dtype))
         return [audio] * num_audios
 
     def _get_dummy_images(
@@ -88,7 +183,16 @@ class BaseDummyInputsBuilder(ABC, Generic[_I]):
         height: int,
         num_images: int,
     ) -> list[Image.Image]:
-        image = Image.new("RGB", (width, height), color=255)
+        """
+        Get :code:`num_images` white images of the given size.
+
+        Note:
+            The returned objects share storage, so do not mutate them.
+        """
+        if num_images == 0:
+            return []
+
+        image = _cached_dummy_image(width, height)
         return [image] * num_images
 
     def _get_dummy_videos(
@@ -99,7 +203,17 @@ class BaseDummyInputsBuilder(ABC, Generic[_I]):
         num_frames: int,
         num_videos: int,
     ) -> list[npt.NDArray]:
-        video = np.full((num_frames, width, height, 3), 255)
+        """
+        Get :code:`num_videos` videos, each consisting of :code:`num_frames`
+        white frames of the given size.
+
+        Note:
+            The returned objects share storage, so do not mutate them.
+        """
+        if num_videos == 0:
+            return []
+
+        video = _cached_dummy_video(width, height, num_frames)
         return [video] * num_videos
 
 
@@ -116,6 +230,20 @@ class MultiModalProfiler(Generic[_I]):
 
         self.processor = processor
 
+        # Running the HF processor on the dummy data is expensive, so reuse
+        # the results across the profiling entrypoints. This relies on the
+        # profiler being kept alive, see `MultiModalRegistry.get_profiler`.
+        self._mm_inputs_cache = LRUCache[_MMInputsCacheKey,
+                                         tuple[MultiModalInputs,
+                                               Mapping[str, int]]](4)
+        # The dummy data of most models does not depend on `seq_len`, so
+        # also reuse the processed outputs across different `seq_len`.
+        # The processor inputs are pinned here (see
+        # `_get_processor_inputs_key`) until the profiler is released.
+        self._processor_outputs_cache = LRUCache[Hashable,
+                                                 tuple[ProcessorInputs,
+                                                       MultiModalInputs]](2)
+
     @property
     def processing_info(self) -> BaseProcessingInfo:
         return self.processor.info
@@ -124,7 +252,12 @@ class MultiModalProfiler(Generic[_I]):
     def dummy_inputs(self) -> BaseDummyInputsBuilder[_I]:
         return self.processor.dummy_inputs
 
-    def get_mm_limits(self) -> Mapping[str, int]:
+    @cached_property
+    def mm_limits(self) -> Mapping[str, int]:
+        """
+        The maximum number of items for each modality that are allowed per
+        prompt, validated against the limits supported by the model.
+        """
         mm_config = self.processing_info.ctx.get_mm_config()
         supported_mm_limits = self.processing_info.get_supported_mm_limits()
 
@@ -143,6 +276,9 @@ class MultiModalProfiler(Generic[_I]):
 
         return mm_limits
 
+    def get_mm_limits(self) -> Mapping[str, int]:
+        return self.mm_limits
+
     def _get_dummy_mm_inputs(
         self,
         seq_len: int,
@@ -152,12 +288,26 @@ class MultiModalProfiler(Generic[_I]):
         processor_inputs = factory.get_dummy_processor_inputs(
             seq_len, mm_counts)
 
-        return self.processor.apply(
+        cache_key = _get_processor_inputs_key(processor_inputs)
+        if cache_key is not None:
+            cached = self._processor_outputs_cache.get(cache_key)
+            if cached is not None:
+                _, mm_inputs = cached
+                return mm_inputs
+
+        mm_inputs = self.processor.apply(
             prompt=processor_inputs.prompt_text,
             mm_data=processor_inputs.mm_data,
             hf_processor_mm_kwargs=processor_inputs.hf_processor_mm_kwargs,
         )
 
+        if cache_key is not None:
+            # Keep the inputs alive so that the IDs in the key remain valid
+            self._processor_outputs_cache[cache_key] = (processor_inputs,
+                                                        mm_inputs)
+
+        return mm_inputs
+
     def get_and_validate_mm_inputs(
         self,
         seq_len: int,
@@ -166,34 +316,45 @@ class MultiModalProfiler(Generic[_I]):
         if mm_counts is None:
             mm_counts = self.get_mm_limits()
 
+        cache_key = _get_mm_inputs_cache_key(seq_len, mm_counts)
+        if (cached := self._mm_inputs_cache.get(cache_key)) is not None:
+            return cached
+
         info = self.processing_info
         mm_max_tokens_per_item = info.get_mm_max_tokens_per_item(
             seq_len, mm_counts)
 
-        if mm_counts.keys() - mm_max_tokens_per_item.keys():
+        if not mm_counts.keys() <= mm_max_tokens_per_item.keys():
+            extra_keys = mm_counts.keys() - mm_max_tokens_per_item.keys()
             raise AssertionError(
                 "The keys returned by `get_supported_mm_limits` "
                 f"({set(mm_counts.keys())}) should be a subset of those "
                 "returned by `get_mm_max_tokens_per_item` "
-                f"({set(mm_max_tokens_per_item.keys())})")
+                f"({set(mm_max_tokens_per_item.keys())}), but found "
+                f"extra keys {extra_keys}")
 
         mm_inputs = self._get_dummy_mm_inputs(seq_len, mm_counts)
         placeholders_by_modality = mm_inputs["mm_placeholders"]
 
-        total_placeholders_by_modality = {
-            modality: sum(item.get_num_embeds() for item in placeholders)
-            for modality, placeholders in placeholders_by_modality.items()
-        }
-        expected_placeholders_by_modality = {
-            modality: mm_max_tokens_per_item[modality] * mm_counts[modality]
-            for modality in placeholders_by_modality
-        }
-        if total_placeholders_by_modality != expected_placeholders_by_modality:
-            raise AssertionError(
-                f"The processed dummy data has a total of "
-                f"{total_placeholders_by_modality} placeholder tokens, which "
-                f"is not the expected {expected_placeholders_by_modality} "
-                "tokens.")
+        total_placeholders_by_modality = dict[str, int]()
+        for modality, placeholders in placeholders_by_modality.items():
+            num_placeholders = sum(item.get_num_embeds()
+                                   for item in placeholders)
+            expected_placeholders = (mm_max_tokens_per_item[modality] *
+                                     mm_counts[modality])
+            if num_placeholders != expected_placeholders:
+                raise AssertionError(
+                    f"The processed dummy data has a total of "
+                    f"{num_placeholders} placeholder tokens for {modality}, "
+                    f"which is not the expected {expected_placeholders} "
+                    "tokens.")
+
+            total_placeholders_by_modality[modality] = num_placeholders
+
+        # NOTE: The outputs are shared between calls, so callers must not
+        # modify them in-place.
+        self._mm_inputs_cache[cache_key] = (mm_inputs,
+                                            total_placeholders_by_modality)
         return mm_inputs, total_placeholders_by_modality
 
     def get_encoder_dummy_data(
@@ -218,21 +379,25 @@ class MultiModalProfiler(Generic[_I]):
             # `max_num_batched_tokens` is defined by `SchedulerConfig`
             logger.warning_once(
                 "The encoder sequence length used for profiling ("
-                f"max_num_batched_tokens / max_num_seqs = {seq_len}) "
-                " is too short "
+                "max_num_batched_tokens / max_num_seqs = %d) is too short "
                 "to hold the multi-modal embeddings in the worst case "
-                f"({total_len} tokens in total, out of which "
-                f"{total_placeholders_by_modality} are reserved for "
+                "(%d tokens in total, out of which %s are reserved for "
                 "multi-modal embeddings). This may cause certain "
                 "multi-modal inputs to fail during inference, even when "
                 "the input text is short. To avoid this, you should "
                 "increase `max_model_len`, reduce `max_num_seqs`, "
-                "and/or reduce `mm_counts`.")
+                "and/or reduce `mm_counts`.",
+                seq_len,
+                total_len,
+                _format_placeholder_counts(total_placeholders_by_modality),
+            )
 
         processor = cast(EncDecMultiModalProcessor, self.processor)
         if processor.pad_dummy_encoder_prompt:
-            num_tokens_to_pad = max(total_len, seq_len) - total_len
-            encoder_prompt_token_ids.extend([0] * num_tokens_to_pad)
+            encoder_prompt_token_ids = _pad_token_ids(
+                encoder_prompt_token_ids, seq_len)
+        else:
+            encoder_prompt_token_ids = list(encoder_prompt_token_ids)
 
         return DummyEncoderData(encoder_prompt_token_ids)
 
@@ -254,19 +419,20 @@ class MultiModalProfiler(Generic[_I]):
             # `max_num_batched_tokens` is defined by `SchedulerConfig`
             logger.warning_once(
                 "The sequence length used for profiling ("
-                f"max_num_batched_tokens / max_num_seqs = {seq_len}) "
-                "is too short "
+                "max_num_batched_tokens / max_num_seqs = %d) is too short "
                 "to hold the multi-modal embeddings in the worst case "
-                f"({total_len} tokens in total, out of which "
-                f"{total_placeholders_by_modality} are reserved for "
+                "(%d tokens in total, out of which %s are reserved for "
                 "multi-modal embeddings). This may cause certain "
                 "multi-modal inputs to fail during inference, even when "
                 "the input text is short. To avoid this, you should "
                 "increase `max_model_len`, reduce `max_num_seqs`, "
-                "and/or reduce `mm_counts`.")
+                "and/or reduce `mm_counts`.",
+                seq_len,
+                total_len,
+                _format_placeholder_counts(total_placeholders_by_modality),
+            )
 
-        if total_len < seq_len:
-            prompt_token_ids.extend([0] * (seq_len - total_len))
+        prompt_token_ids = _pad_token_ids(prompt_token_ids, seq_len)
 
         return DummyDecoderData(
             prompt_token_ids=prompt_token_ids,
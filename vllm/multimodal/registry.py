@@ -122,6 +122,11 @@ class MultiModalRegistry:
 
         self._processing_cache = ProcessingCache(VLLM_MM_INPUT_CACHE_GIB)
 
+        # The profiler caches the processed dummy inputs, so it is kept
+        # alive across profiling calls until `reset_profiler_cache`
+        self._profiler_by_model = dict[
+            "ModelConfig", MultiModalProfiler[BaseProcessingInfo]]()
+
     def register_plugin(self, plugin: MultiModalPlugin) -> None:
         """
         Register a multi-modal plugin so it can be recognized by vLLM.
@@ -257,10 +262,10 @@ class MultiModalRegistry:
         on underlying model configuration.
         """
         if self.has_processor(model_config):
-            processor = self.create_processor(model_config, disable_cache=True)
+            profiler = self.get_profiler(model_config)
             seq_len = model_config.max_model_len
-            mm_limits = self.get_mm_limits_per_prompt(model_config)
-            return processor.info.get_mm_max_tokens_per_item(
+            mm_limits = profiler.get_mm_limits()
+            return profiler.processing_info.get_mm_max_tokens_per_item(
                 seq_len, mm_limits)
 
         return {
@@ -371,8 +376,7 @@ class MultiModalRegistry:
             This should be called after :meth:`init_mm_limits_per_prompt`.
         """
         if self.has_processor(model_config):
-            processor = self.create_processor(model_config, disable_cache=True)
-            profiler = MultiModalProfiler(processor)
+            profiler = self.get_profiler(model_config)
             return profiler.get_mm_limits()
 
         return self._limits_by_model[model_config]
@@ -454,6 +458,33 @@ class MultiModalRegistry:
 
         return factories.build_processor(ctx, cache=cache)
 
+    def get_profiler(
+        self,
+        model_config: "ModelConfig",
+    ) -> MultiModalProfiler[BaseProcessingInfo]:
+        """
+        Get the profiler for a specific model.
+
+        The profiler is created once per model so that the processed dummy
+        inputs are reused across profiling calls. Call
+        :meth:`reset_profiler_cache` once profiling is done to release them.
+        """
+        profiler = self._profiler_by_model.get(model_config)
+        if profiler is None:
+            processor = self.create_processor(model_config,
+                                              disable_cache=True)
+            profiler = MultiModalProfiler(processor)
+            self._profiler_by_model[model_config] = profiler
+
+        return profiler
+
+    def reset_profiler_cache(self) -> None:
+        """
+        Release the profilers created by :meth:`get_profiler`, along with
+        the processors and processed dummy inputs that they hold.
+        """
+        self._profiler_by_model.clear()
+
     def get_decoder_dummy_data(
         self,
         model_config: "ModelConfig",
@@ -465,8 +496,7 @@ class MultiModalRegistry:
 
         The model is identified by ``model_config``.
         """
-        processor = self.create_processor(model_config, disable_cache=True)
-        profiler = MultiModalProfiler(processor)
+        profiler = self.get_profiler(model_config)
         dummy_data = profiler.get_decoder_dummy_data(seq_len, mm_counts)
 
         # Having more tokens is over-conservative but otherwise fine
@@ -489,8 +519,7 @@ class MultiModalRegistry:
 
         The model is identified by ``model_config``.
         """
-        processor = self.create_processor(model_config, disable_cache=True)
-        profiler = MultiModalProfiler(processor)
+        profiler = self.get_profiler(model_config)
         dummy_data = profiler.get_encoder_dummy_data(seq_len, mm_counts)
 
         # Having more tokens is over-conservative but otherwise fine
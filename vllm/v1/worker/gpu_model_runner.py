@@ -1597,6 +1597,7 @@ class GPUModelRunner(LoRAModelRunnerMixin):
         torch.cuda.synchronize()
         del hidden_states, sampler_output
         self.encoder_cache.clear()
+        self.mm_registry.reset_profiler_cache()
         gc.collect()
 
     def capture_model(self) -> None:
@@ -328,6 +328,7 @@ class EncoderDecoderModelRunner(GPUModelRunnerBase[EncoderDecoderModelInput]):
         intermediate_tensors = None
         self.execute_model(model_input, None, intermediate_tensors)
         torch.cuda.synchronize()
+        self.mm_registry.reset_profiler_cache()
         return
 
     def _prepare_encoder_model_input_tensors(
@@ -1241,6 +1241,7 @@ class GPUModelRunnerBase(ModelRunnerBase[TModelInputForGPU]):
             self.scheduler_config.max_num_batched_tokens
         max_num_seqs = self.scheduler_config.max_num_seqs
         self._dummy_run(max_num_batched_tokens, max_num_seqs)
+        self.mm_registry.reset_profiler_cache()
 
     def _add_dummy_loras(self, num_loras: int) -> list[LoRARequest]:
         assert num_loras > 0
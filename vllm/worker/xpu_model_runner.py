@@ -495,6 +495,7 @@ class XPUModelRunner(ModelRunnerBase[ModelInputForXPUWithSamplingMetadata]):
                 device=self.device)
         self.execute_model(model_input, None, intermediate_tensors)
         torch.xpu.synchronize()
+        self.mm_registry.reset_profiler_cache()
         return
 
     def make_model_input_from_broadcasted_tensor_dict(